@@ -0,0 +1,22 @@
+# cython: language_level=3
+""" Compiled hot path for the extract methods in dbaccess_rest.
+
+Pulling the "value" field out of every parsed SODA item is a tight loop over
+potentially millions of dicts. Doing it in C skips the per-element Python
+dispatch overhead. Build the extension in place with:
+
+    python setup.py build_ext --inplace
+
+The callers fall back to an equivalent list comprehension when the extension
+has not been built.
+"""
+
+
+def extract_values(list items):
+    """Return [item["value"] for item in items] using C-level list access."""
+    cdef Py_ssize_t n = len(items)
+    cdef Py_ssize_t i
+    out = [None] * n
+    for i in range(n):
+        out[i] = (<dict>items[i])["value"]
+    return out
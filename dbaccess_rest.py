@@ -5,11 +5,58 @@ a managed JSON database from Oracle. The APIs defined here use SODA
 commands exchanged using a REST protocol.
 """
 import sys
-import requests
-import json
+import time
+import gzip
 import copy
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import urllib3
 import constants as ct
 
+try:
+    import httpx
+except ImportError:
+    # httpx is optional. Without it the extract methods fall back to the
+    # sequential one-page-at-a-time loop.
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional. Without it every response is parsed eagerly.
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library parser. It exposes the same
+    # loads/dumps interface, just without the speedup.
+    import json as orjson
+
+try:
+    from _fastiter import extract_values
+except ImportError:
+    # The compiled extension has not been built (see setup.py). The plain
+    # comprehension is equivalent, just slower on very large pages.
+    def extract_values(items):
+        return [it["value"] for it in items]
+
+
+# Collection listings change rarely within a session, so the parsed response
+# is cached per user for a short time. Entries map user -> (fetch time, dict).
+_COLLECTIONS_CACHE = {}
+_COLLECTIONS_CACHE_TTL = 30.0
+
+# Request bodies above this size are gzipped before upload. JSON documents
+# are dominated by repeated keys, so compression roughly halves the bytes on
+# the wire; tiny query filters are not worth the compression overhead.
+_GZIP_MIN_BYTES = 1024
+
+# Query responses at or above this size are parsed incrementally with ijson,
+# keeping peak memory at one document instead of the whole response tree.
+# Smaller responses are parsed eagerly, which is faster.
+_STREAM_MIN_BYTES = 8 * 1024 * 1024
+
 
 class DatabaseUnableToCreate(Exception):
     def __init__(self, message):
@@ -60,19 +107,64 @@ class JsonDatabase:
         create_coll: A boolean flag. If True, it creates a collection. If it exists, it
            raises an error. If the flag is False, the named collection should be available
            prior to instantiation.
+        page_size: the maximum number of documents requested per query. Larger pages
+           mean fewer HTTP round-trips when extracting data.
     """
 
-    def __init__(self, user, password, collection_name, create_coll=False, overwrite=False):
+    def __init__(self, user, password, collection_name, create_coll=False, overwrite=False,
+                 page_size=1000):
         self.__user = user
         self.__pword = password
         self.__collname = collection_name
+        self.__page_size = page_size
+        self.__meta_cache = None
+        self.__has_spatial_index = False
 
         url_tail = user + "/soda/latest/" + collection_name
         self.__baseurl = ct.DB_BASE_URL + url_tail
+        # URLs are invariant for the lifetime of the instance, so they are
+        # built once here instead of per request in the paginated loops.
+        self.__query_url = self.__baseurl + "?action=query&limit=%d&offset=%d"
+        self.__meta_query_url = self.__baseurl + "?action=query"
+        self.__insert_url = self.__baseurl + "?action=insert"
+
+        # A pooled urllib3 client keeps connections alive between calls, so
+        # paginated extracts do not pay a new handshake per page, and it has
+        # lower per-request overhead than requests for small SODA queries.
+        # The basic-auth and encoding headers are baked in once; responses
+        # arrive compressed and are decoded transparently.
+        self.__headers = urllib3.make_headers(
+            basic_auth=user + ":" + password,
+            accept_encoding="gzip,deflate", keep_alive=True)
+        self.__retries = urllib3.util.Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        self.__http = urllib3.PoolManager(
+            num_pools=4, maxsize=16, headers=self.__headers)
+        self.__json_headers = dict(self.__headers)
+        self.__json_headers["Content-Type"] = "application/json"
+
+        # Everything a POST needs besides the URL and body is fixed for the
+        # lifetime of the instance, so bind it all as closure defaults once
+        # and skip the attribute lookups on every call of the hot path.
+        def _post(url, body, headers, preload=True,
+                  _request=self.__http.request, _retries=self.__retries):
+            return _request("POST", url, body=body, headers=headers,
+                            retries=_retries, preload_content=preload)
+        self.__post = _post
 
         if create_coll:
             self.__create_collection(overwrite)
 
+    def close(self):
+        """Release the pooled HTTP connections."""
+        self.__http.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __create_collection(self, overwrite):
         """Create a new collection in the database"""
         all_colls = self.list_collections()
@@ -82,12 +174,35 @@ class JsonDatabase:
             else:
                 raise DatabaseCollectionExists(
                     "{} already exists".format(self.__collname))
-        resp = requests.put(url=self.__baseurl,
-                            auth=(self.__user, self.__pword))
-        if resp.status_code > 299:
-            error_desc = str(resp.status_code) + " " + resp.reason
+        resp = self.__http.request(
+            "PUT", self.__baseurl, retries=self.__retries)
+        if resp.status > 299:
+            error_desc = str(resp.status) + " " + resp.reason
+            raise DatabaseUnableToCreate(error_desc)
+        else:
+            _COLLECTIONS_CACHE.pop(self.__user, None)
+            return 1
+
+    def create_spatial_index(self, index_name="geo_idx"):
+        """Create a spatial index on the geometry field of the collection.
+        Once the index exists, tile and region queries are expressed with the
+        $within operator so the server can evaluate the bounding box in one
+        indexed lookup instead of three range scans.
+        Returns 1 if successful. Otherwise it raises an exception.
+        """
+        index_url = ct.DB_BASE_URL + self.__user + \
+            "/soda/latest/index/" + self.__collname
+        index_spec = {"name": index_name, "spatial": "geometry"}
+        headers = dict(self.__headers)
+        headers["Content-Type"] = "application/json"
+        resp = self.__http.request(
+            "PUT", index_url, body=orjson.dumps(index_spec),
+            headers=headers, retries=self.__retries)
+        if resp.status > 299:
+            error_desc = str(resp.status) + " " + resp.reason
             raise DatabaseUnableToCreate(error_desc)
         else:
+            self.__has_spatial_index = True
             return 1
 
     def list_collections(self, only_names=True):
@@ -96,23 +211,26 @@ class JsonDatabase:
             A list of collection names if the argument only_names is True. Otherwise, it returns
             a dictionary with schema info for all the database collections
         """
-        url_tail = self.__user + "/soda/latest"
-        resp = self.__make_get_request(target_url=ct.DB_BASE_URL + url_tail)
-
-        if resp.get("status") == "ok":
-            resp_dict = json.loads(resp.get("data"))
-            if only_names:
-                items = resp_dict.get("items", None)
-                if items is None:
-                    return []
-                else:
-                    names = [it.get("name") for it in items]
-                    return names
-            else:
-                return resp_dict
+        cached = _COLLECTIONS_CACHE.get(self.__user)
+        if cached is not None and \
+                time.monotonic() - cached[0] < _COLLECTIONS_CACHE_TTL:
+            resp_dict = cached[1]
         else:
-            error_msg = str(resp.get("code")) + " " + resp.get("reason")
-            raise DatabaseUnableToAccess(message=error_msg)
+            url_tail = self.__user + "/soda/latest"
+            resp = self.__make_get_request(
+                target_url=ct.DB_BASE_URL + url_tail)
+            if resp.get("status") != "ok":
+                error_msg = str(resp.get("code")) + " " + resp.get("reason")
+                raise DatabaseUnableToAccess(message=error_msg)
+            resp_dict = orjson.loads(resp.get("data"))
+            _COLLECTIONS_CACHE[self.__user] = (time.monotonic(), resp_dict)
+
+        if only_names:
+            return [it["name"] for it in resp_dict.get("items", ())]
+        else:
+            # A copy, so callers mutating the returned schema cannot corrupt
+            # the shared cache entry.
+            return copy.deepcopy(resp_dict)
 
     def delete_collection(self):
         """Delete a collection. Returns 1 if successful. It raises an error if there is
@@ -123,6 +241,8 @@ class JsonDatabase:
             error_msg = str(resp.get("code")) + " " + resp.get("reason")
             raise DatabaseUnableToDelete(message=error_msg)
         else:
+            _COLLECTIONS_CACHE.pop(self.__user, None)
+            self.__meta_cache = None
             return 1
 
     def add_item(self, item_dict):
@@ -143,14 +263,12 @@ class JsonDatabase:
         in metadata_dict. This method returns 1 if successful. Otherwise it raises an exception.
         A collection can have only 1 metadata document. An attempt to create a second metadata
         document raises an error.
+        Note: metadata_dict is referenced, not copied, as in add_item. The caller must not
+        mutate it while the call is in progress.
         """
-        formatted_dict = dict()
-        formatted_dict["type"] = "Metadata"
-        formatted_dict["content"] = copy.deepcopy(metadata_dict)
+        formatted_dict = {"type": "Metadata", "content": metadata_dict}
 
-        current_meta = self.extract_metadata()
-
-        if current_meta:
+        if self._metadata_exists():
             error_msg = "A collection can have only 1 metadata document."
             raise DatabaseMetadataAlreadyExists(error_msg)
 
@@ -160,16 +278,40 @@ class JsonDatabase:
             error_msg = str(resp.get("code")) + " " + resp.get("reason")
             raise DatabaseUnableToAddItem(message=error_msg)
         else:
+            # Cache a copy; the caller keeps ownership of metadata_dict and
+            # may mutate it after the call.
+            self.__meta_cache = copy.deepcopy(metadata_dict)
             return 1
 
+    def _metadata_exists(self):
+        """Check whether the collection already holds a metadata document. The
+        query asks only for the document id with a limit of 1, so the check
+        never fetches or parses the metadata content itself.
+        """
+        if self.__meta_cache is not None:
+            return True
+        check_url = self.__meta_query_url + "&fields=id&limit=1"
+        qdata = {"type": {"$eq": "Metadata"}}
+        resp = self.__make_post_request(
+            target_url=check_url, payload_dict=qdata)
+        if resp['status'] == 'ok':
+            returned_data = orjson.loads(resp.get("data"))
+            return returned_data.get("count", 0) >= 1
+        else:
+            error_msg = str(resp.get("code")) + " " + resp.get("reason")
+            raise DatabaseUnableToExtractData(message=error_msg)
+
     def extract_metadata(self):
-        extract_url = self.__baseurl + "?action=query"
+        if self.__meta_cache is not None:
+            return copy.deepcopy(self.__meta_cache)
+
+        extract_url = self.__meta_query_url
         qdata = {"type": {"$eq": "Metadata"}}
         resp = self.__make_post_request(
             target_url=extract_url, payload_dict=qdata)
 
         if resp['status'] == 'ok':
-            returned_data = json.loads(resp.get("data"))
+            returned_data = orjson.loads(resp.get("data"))
             all_items = returned_data.get("items")
             count = returned_data.get("count")
 
@@ -179,144 +321,261 @@ class JsonDatabase:
                 raise DatabaseTooManyMetadataDocs(error_msg)
 
             elif count == 0:
+                # An empty result is not cached so that a later add_metadata
+                # still re-checks the collection.
                 return {}
             else:
                 extracted = all_items[0].get("value").get("content")
+                # Cache a copy so mutations of the returned dict do not bleed
+                # into later extract_metadata results.
+                self.__meta_cache = copy.deepcopy(extracted)
                 return extracted
         else:
             error_msg = str(resp.get("code")) + " " + resp.get("reason")
             raise DatabaseUnableToExtractData(message=error_msg)
 
-    def add_multiple_items(self, items_list):
+    def add_multiple_items(self, items_list, chunk_size=1000):
         """Add multiple items (documents) to the database. An item_list contains a list of items. Each
         item is a dictionary that will be saved as a json object in the database. Hence, the dictionary
         must be such that it can be translated into a json object.
+        The list is inserted in chunks of chunk_size documents, so a very large
+        list is never serialized into a single request. When there is more than
+        one chunk, the chunks are posted concurrently over the pooled session.
         Returns 1 if successful. Otherwise it raises an error.
         """
-        insert_url = self.__baseurl + "?action=insert"
-        resp = self.__make_post_request(
-            target_url=insert_url, payload_dict=items_list)
-        if resp['status'] == "error":
-            error_msg = str(resp.get("code")) + " " + resp.get("reason")
-            raise DatabaseUnableToAddItem(message=error_msg)
+        insert_url = self.__insert_url
+        chunks = [items_list[i:i + chunk_size]
+                  for i in range(0, len(items_list), chunk_size)]
+        if len(chunks) <= 1:
+            responses = [self.__make_post_request(
+                target_url=insert_url, payload_dict=chunk) for chunk in chunks]
         else:
-            return 1
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                responses = list(pool.map(
+                    lambda chunk: self.__make_post_request(
+                        target_url=insert_url, payload_dict=chunk), chunks))
+        for resp in responses:
+            if resp['status'] == "error":
+                error_msg = str(resp.get("code")) + " " + resp.get("reason")
+                raise DatabaseUnableToAddItem(message=error_msg)
+        return 1
 
     def extract_items(self, z_layer):
         """ Extract nuclear items at a given z layer"""
-        offset = 0
-        has_more = True
-        items = []
-        while has_more:
-            extract_url = self.__baseurl + \
-                "?action=query&offset={}".format(offset)
-            qdata = {"geometry.coordinates[2]": {"$eq": z_layer}}
-            resp = self.__make_post_request(
-                target_url=extract_url, payload_dict=qdata)
-            if resp['status'] == 'ok':
-                returned_data = json.loads(resp.get("data"))
-                all_items = returned_data.get("items")
-                count = returned_data.get("count")
-                has_more = returned_data.get("hasMore")
-                offset += count
-
-                if count > 0:
-                    extracted = [copy.deepcopy(it.get("value"))
-                                 for it in all_items]
-                    items += extracted
-            else:
-                error_msg = str(resp.get("code")) + " " + resp.get("reason")
-                raise DatabaseUnableToExtractData(message=error_msg)
-        return items
+        qdata = {"geometry.coordinates[2]": {"$eq": z_layer}}
+        return self.__run_query(qdata)
 
     def extract_tile_data(self, z_layer, x0, y0, tile_size=256):
         """Extract nuclear data for a tile of a given size whose origin is at (x0, y0).
-        Note: This function uses the $between comparison operator to check if a point belongs to
-        a tile. We may want to replace this operation and use the $within operator for GeoJson data. It
-        might be a faster way to perform queries.
+        Note: When the collection has a spatial index (see create_spatial_index), the
+        tile is queried with the $within operator for GeoJson data. Otherwise, this
+        function uses the $between comparison operator to check if a point belongs
+        to the tile.
         """
         xf = x0 + tile_size - 1
         yf = y0 + tile_size - 1
-        offset = 0
-        has_more = True
-        items = []
-        while has_more:
-            extract_url = self.__baseurl + \
-                "?action=query&offset={}".format(offset)
-            qdata = {"geometry.coordinates[2]": {"$eq": z_layer},
-                     "geometry.coordinates[0]": {"$between": [x0, xf]},
-                     "geometry.coordinates[1]": {"$between": [y0, yf]},
-                     }
-            resp = self.__make_post_request(
-                target_url=extract_url, payload_dict=qdata)
-            if resp['status'] == 'ok':
-                returned_data = json.loads(resp.get("data"))
-                all_items = returned_data.get("items")
-                count = returned_data.get("count")
-                has_more = returned_data.get("hasMore")
-                offset += count
-
-                if count > 0:
-                    extracted = [copy.deepcopy(it.get("value"))
-                                 for it in all_items]
-                    items += extracted
-            else:
-                error_msg = str(resp.get("code")) + " " + resp.get("reason")
-                raise DatabaseUnableToExtractData(message=error_msg)
-        return items
+        qdata = self.__box_query(z_layer, x0, y0, xf, yf)
+        return self.__run_query(qdata)
 
     def extract_region(self, z_layer, x0, y0, xf, yf):
-        """Extract nuclei data for a specified bounding box at specified layer. 
-        The top left coordinate of the bounding box is (x0, y0) and the bottom 
+        """Extract nuclei data for a specified bounding box at specified layer.
+        The top left coordinate of the bounding box is (x0, y0) and the bottom
         right coordinate is (xf, yf).
         """
+        qdata = self.__box_query(z_layer, x0, y0, xf, yf)
+        return self.__run_query(qdata)
+
+    def __box_query(self, z_layer, x0, y0, xf, yf):
+        """Build the query filter for a bounding box at a given layer. When the
+        collection has a spatial index, the box is expressed as a GeoJSON
+        polygon with $within so the server evaluates it in one indexed lookup.
+        Otherwise, three $between range comparisons are used.
+        """
+        if self.__has_spatial_index:
+            polygon = {"type": "Polygon",
+                       "coordinates": [[[x0, y0], [xf, y0], [xf, yf],
+                                        [x0, yf], [x0, y0]]]}
+            return {"geometry": {"$within": {"$geometry": polygon}},
+                    "geometry.coordinates[2]": {"$eq": z_layer},
+                    }
+        return {"geometry.coordinates[2]": {"$eq": z_layer},
+                "geometry.coordinates[0]": {"$between": [x0, xf]},
+                "geometry.coordinates[1]": {"$between": [y0, yf]},
+                }
+
+    def __run_query(self, qdata):
+        """Run a paginated query and return the matching documents as a list.
+        When httpx is installed, the pages after the first are fetched
+        concurrently; otherwise they are fetched one at a time. The concurrent
+        path only applies when no event loop is already running (asyncio.run
+        cannot nest) and hands back to the sequential loop whenever it cannot
+        guarantee a complete result set.
+        """
+        if httpx is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                items = asyncio.run(self._query_async(qdata))
+                if items is not None:
+                    return items
+        return list(self._query_paginated(qdata))
+
+    def _query_paginated(self, qdata, page_size=None):
+        """Run a paginated query, yielding each matching document as it
+        arrives. Callers that only iterate over the results can consume the
+        generator lazily without holding all documents in memory.
+        """
+        if page_size is None:
+            page_size = self.__page_size
         offset = 0
         has_more = True
-        items = []
         while has_more:
-            extract_url = self.__baseurl + \
-                "?action=query&offset={}".format(offset)
-            qdata = {"geometry.coordinates[2]": {"$eq": z_layer},
-                     "geometry.coordinates[0]": {"$between": [x0, xf]},
-                     "geometry.coordinates[1]": {"$between": [y0, yf]},
-                     }
+            extract_url = self.__query_url % (page_size, offset)
+            stream = ijson is not None
             resp = self.__make_post_request(
-                target_url=extract_url, payload_dict=qdata)
-            if resp['status'] == 'ok':
-                returned_data = json.loads(resp.get("data"))
-                all_items = returned_data.get("items")
-                count = returned_data.get("count")
-                has_more = returned_data.get("hasMore")
-                offset += count
-                if count > 0:
-                    extracted = [copy.deepcopy(it.get("value"))
-                                 for it in all_items]
-                    items += extracted
-            else:
+                target_url=extract_url, payload_dict=qdata, stream=stream)
+            if resp['status'] != 'ok':
                 error_msg = str(resp.get("code")) + " " + resp.get("reason")
                 raise DatabaseUnableToExtractData(message=error_msg)
-        return items
-
-    def __make_post_request(self, target_url, payload_dict):
-        # Note: the json argument automatically sets the content-type header to application/json
-        resp = requests.post(url=target_url, auth=(
-            self.__user, self.__pword), json=payload_dict)
-        if 200 <= resp.status_code <= 299:
-            return {"status": "ok", "code": resp.status_code, "data": resp.text}
+            if stream:
+                raw = resp.get("resp")
+                try:
+                    length = raw.headers.get("Content-Length")
+                    if length is not None and int(length) < _STREAM_MIN_BYTES:
+                        # Small page: eager parsing is faster than streaming.
+                        returned_data = orjson.loads(raw.read())
+                    else:
+                        # Huge page: yield each document as it is parsed, so
+                        # the whole response tree is never held in memory.
+                        # Walking the raw parse events (instead of
+                        # ijson.items) also captures the count/hasMore tail
+                        # fields that follow the items in the stream, so
+                        # pagination uses the server's own flag rather than
+                        # guessing from the number of documents returned.
+                        count = 0
+                        has_more = False
+                        builder = None
+                        for prefix, event, value in ijson.parse(raw):
+                            if builder is not None:
+                                builder.event(event, value)
+                                if prefix == "items.item.value" and \
+                                        event in ("end_map", "end_array"):
+                                    count += 1
+                                    yield builder.value
+                                    builder = None
+                            elif prefix == "items.item.value":
+                                if event in ("start_map", "start_array"):
+                                    builder = ijson.ObjectBuilder()
+                                    builder.event(event, value)
+                                else:
+                                    count += 1
+                                    yield value
+                            elif prefix == "hasMore":
+                                has_more = value
+                        offset += count
+                        continue
+                finally:
+                    raw.release_conn()
+            else:
+                returned_data = orjson.loads(resp.get("data"))
+            all_items = returned_data.get("items")
+            count = returned_data.get("count")
+            has_more = returned_data.get("hasMore")
+            offset += count
+            yield from extract_values(all_items)
+
+    async def _query_async(self, qdata):
+        """Run a paginated query, fetching the pages after the first one
+        concurrently. The first request asks the server for the total result
+        count, the remaining offsets are then known up front and are issued
+        together with at most 8 requests in flight.
+        Returns None when the complete result set cannot be guaranteed: the
+        probe may not report totalResults, or the server may cap pages below
+        the requested page_size so the precomputed offsets skip documents. In
+        both cases the caller must rerun the query with the sequential loop,
+        which pages by the actual returned count.
+        """
+        headers = {"Content-Type": "application/json"}
+        limits = httpx.Limits(max_connections=16)
+        async with httpx.AsyncClient(auth=(self.__user, self.__pword),
+                                     limits=limits) as client:
+            probe_url = self.__query_url % (self.__page_size, 0) + \
+                "&totalResults=true"
+            resp = await client.post(
+                probe_url, content=orjson.dumps(qdata), headers=headers)
+            if resp.status_code > 299:
+                error_msg = str(resp.status_code) + " " + resp.reason_phrase
+                raise DatabaseUnableToExtractData(message=error_msg)
+            returned_data = orjson.loads(resp.content)
+            items = extract_values(returned_data.get("items"))
+
+            total = returned_data.get("totalResults")
+            if total is None:
+                if not returned_data.get("hasMore"):
+                    return items
+                return None
+            if total <= len(items):
+                return items
+
+            semaphore = asyncio.Semaphore(8)
+
+            async def fetch_page(offset):
+                page_url = self.__query_url % (self.__page_size, offset)
+                async with semaphore:
+                    return await client.post(
+                        page_url, content=orjson.dumps(qdata), headers=headers)
+
+            offsets = range(len(items), total, self.__page_size)
+            responses = await asyncio.gather(
+                *[fetch_page(offset) for offset in offsets])
+            for resp in responses:
+                if resp.status_code > 299:
+                    error_msg = str(resp.status_code) + " " + resp.reason_phrase
+                    raise DatabaseUnableToExtractData(message=error_msg)
+                page_data = orjson.loads(resp.content)
+                items.extend(extract_values(page_data.get("items")))
+            if len(items) != total:
+                return None
+            return items
+
+    def __make_post_request(self, target_url, payload_dict, stream=False):
+        # The body is serialized with orjson, so the content-type header is set
+        # explicitly. Per-request headers replace the pool defaults in urllib3,
+        # hence the merge with the baked-in auth/encoding headers.
+        body = orjson.dumps(payload_dict)
+        if isinstance(body, str):
+            # The stdlib json fallback returns a str instead of bytes.
+            body = body.encode("utf-8")
+        headers = self.__json_headers
+        if len(body) >= _GZIP_MIN_BYTES:
+            body = gzip.compress(body)
+            headers = dict(headers)
+            headers["Content-Encoding"] = "gzip"
+        if stream:
+            # Leave the body on the socket so the caller can parse it
+            # incrementally. The caller must release the connection.
+            resp = self.__post(target_url, body, headers, preload=False)
+            if 200 <= resp.status <= 299:
+                return {"status": "ok", "code": resp.status, "resp": resp}
+            resp.drain_conn()
+            return {"status": "error", "code": resp.status, "reason": resp.reason}
+        resp = self.__post(target_url, body, headers)
+        if 200 <= resp.status <= 299:
+            return {"status": "ok", "code": resp.status, "data": resp.data}
         else:
-            return {"status": "error", "code": resp.status_code, "reason": resp.reason}
+            return {"status": "error", "code": resp.status, "reason": resp.reason}
 
     def __make_get_request(self, target_url):
-        resp = requests.get(url=target_url, auth=(self.__user, self.__pword))
-        if 200 <= resp.status_code <= 299:
-            return {"status": "ok", "code": resp.status_code, "data": resp.text}
+        resp = self.__http.request("GET", target_url, retries=self.__retries)
+        if 200 <= resp.status <= 299:
+            return {"status": "ok", "code": resp.status, "data": resp.data}
         else:
-            return {"status": "error", "code": resp.status_code, "reason": resp.reason}
+            return {"status": "error", "code": resp.status, "reason": resp.reason}
 
     def __make_delete_request(self, target_url):
-        resp = requests.delete(
-            url=target_url, auth=(self.__user, self.__pword))
-        if resp.status_code == 200:
-            return {"status": "ok", "code": resp.status_code}
+        resp = self.__http.request(
+            "DELETE", target_url, retries=self.__retries)
+        if resp.status == 200:
+            return {"status": "ok", "code": resp.status}
         else:
-            return {"status": "error", "code": resp.status_code, "reason": resp.reason}
+            return {"status": "error", "code": resp.status, "reason": resp.reason}
@@ -11,6 +11,8 @@ PASSWORD = os.getenv("AJDPASS", None)
 
 COLL_NAME = "b123___p123__20201230"
 
+RLE_EXAMPLE = "2098177 8 2100225 8 2102273 8 2104321 8 2106369 8 2108417 8 2110465 8 2112513 8"
+
 if PASSWORD is None:
     print("No password defined to run the code")
     sys.exit(1)
@@ -74,11 +76,7 @@ def example_add_and_retrieve_data():
     mydb = dba.JsonDatabase(user=USER, password=PASSWORD, collection_name=my_collection, create_coll=True)
 
     # 2. Add items to the collection
-    items = list()
-    items.append(generate_one_item_at_layer(0))
-    items.append(generate_one_item_at_layer(0))
-    items.append(generate_one_item_at_layer(0))
-    items.append(generate_one_item_at_layer(1))
+    items = generate_items(3, z_layer=0) + generate_items(1, z_layer=1)
 
     mydb.add_multiple_items(items_list=items)
 
@@ -170,44 +168,39 @@ def example_read_tile_items():
         print(entry)
 
 
+def generate_items(n, z_layer=None):
+    """Generate n dummy items for database insert operations. All the random values
+    are drawn in one vectorized call per field, which is much faster than generating
+    items one at a time. The z coordinates are random unless the z_layer argument
+    is given, in which case all items are placed at that layer."""
+    rng = np.random.default_rng()
+    areas = rng.integers(400, 600, n)
+    perimeters = rng.integers(100, 220, n)
+    xs = rng.integers(0, 2048, n)
+    ys = rng.integers(0, 2048, n)
+    zs = rng.integers(0, 3, n) if z_layer is None else np.full(n, z_layer)
+
+    items = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [int(x), int(y), int(z)]},
+            "properties": {"rle": RLE_EXAMPLE, "area": int(a), "perimeter": int(p)},
+        }
+        for a, p, x, y, z in zip(areas, perimeters, xs, ys, zs)
+    ]
+    return items
+
+
 def generate_one_item():
     """Generate a dummy item for database insert operations. It generates an item with different area,
     perimeter, x, y, and z values."""
-    target_area = int(np.random.uniform(400, 600))
-    target_perimeter = int(np.random.uniform(100, 220))
-    target_x = int(np.random.uniform(0, 2048))
-    target_y = int(np.random.uniform(0, 2048))
-    target_z_layer = int(np.random.uniform(0, 3))
-
-    item = dict()
-    item["type"] = "Feature"
-    item["geometry"] = {"type": "Point", "coordinates": [target_x, target_y, target_z_layer]}
-    item["properties"] = {
-        "rle": "2098177 8 2100225 8 2102273 8 2104321 8 2106369 8 2108417 8 2110465 8 2112513 8",
-        "area": target_area,
-        "perimeter": target_perimeter,
-    }
-    return item
+    return generate_items(1)[0]
 
 
 def generate_one_item_at_layer(z_layer):
     """Generate a dummy item for database insert operations. It generates an item with random area,
     perimeter, x, and y. The z coordinate is defined by the z_layer argument."""
-    target_area = int(np.random.uniform(400, 600))
-    target_perimeter = int(np.random.uniform(100, 220))
-    target_x = int(np.random.uniform(0, 2048))
-    target_y = int(np.random.uniform(0, 2048))
-    target_z_layer = z_layer
-
-    item = dict()
-    item["type"] = "Feature"
-    item["geometry"] = {"type": "Point", "coordinates": [target_x, target_y, target_z_layer]}
-    item["properties"] = {
-        "rle": "2098177 8 2100225 8 2102273 8 2104321 8 2106369 8 2108417 8 2110465 8 2112513 8",
-        "area": target_area,
-        "perimeter": target_perimeter,
-    }
-    return item
+    return generate_items(1, z_layer=z_layer)[0]
 
 
 def generate_one_item_at_position(x, y, z):
@@ -221,7 +214,7 @@ def generate_one_item_at_position(x, y, z):
     item["type"] = "Feature"
     item["geometry"] = {"type": "Point", "coordinates": [x, y, z]}
     item["properties"] = {
-        "rle": "2098177 8 2100225 8 2102273 8 2104321 8 2106369 8 2108417 8 2110465 8 2112513 8",
+        "rle": RLE_EXAMPLE,
         "area": target_area,
         "perimeter": target_perimeter,
     }
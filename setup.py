@@ -0,0 +1,15 @@
+""" Build script for the optional _fastiter Cython extension.
+
+Usage:
+    python setup.py build_ext --inplace
+
+The database access code works without the extension; building it speeds up
+the post-parse item extraction in the extract methods.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="nuclear-segmentation-database",
+    ext_modules=cythonize("_fastiter.pyx"),
+)